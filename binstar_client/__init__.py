@@ -5,31 +5,92 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import collections
+import contextlib
+import functools
 import hashlib
 import logging
 import os
 import platform as _platform
+import types
+import typing
+from concurrent import futures
+from time import monotonic
 
-import defusedxml.ElementTree as ET
 import requests
 from pkg_resources import parse_version as pv
-from six.moves.urllib.parse import quote
+from six.moves.urllib.parse import quote, urlparse
 from tqdm import tqdm
+from urllib3.util import Retry
 
 from . import errors
 from .__about__ import __version__
 # For backwards compatibility
-from .errors import *
+from .errors import (  # pylint: disable=unused-import
+    BinstarError, ClyentError, Conflict, DestinationPathExists, NoMetadataError, NotFound, PillowNotInstalled,
+    ServerError, ShowHelp, Unauthorized, UserError,
+)
 from .mixins.channels import ChannelsMixin
 from .mixins.organizations import OrgMixin
 from .mixins.package import PackageMixin
-from .requests_ext import NullAuth
-from .utils import compute_hash, jencode
+from .requests_ext import KeepAliveAdapter, NullAuth
+from .utils import compute_hashes, jencode
 from .utils.http_codes import STATUS_CODES
 from .utils.multipart_uploader import multipart_files_upload
 
 logger = logging.getLogger('binstar')
 
+DEFAULT_POOL_SIZE = 32
+
+# Number of seconds for which a successful `check_server` is trusted
+SERVER_CHECK_TTL = 60
+
+# Maximum number of keep-alive connections kept per storage backend host
+STORAGE_POOL_SIZE = 16
+
+
+def _make_retry():
+    """Retry policy for transient failures (rate limiting and server-side errors)."""
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS']),
+        raise_on_status=False,
+    )
+
+
+# Shared session for requests to the storage backend (e.g. S3 signed URLs). Such requests must not carry the custom
+# headers and token of the API session, but should still reuse connections across consecutive files.
+_s3_session = requests.Session()
+_s3_session.mount('https://', KeepAliveAdapter(pool_connections=8, pool_maxsize=STORAGE_POOL_SIZE))
+_s3_session.mount('http://', KeepAliveAdapter(pool_connections=8, pool_maxsize=STORAGE_POOL_SIZE))
+
+# Authentication type reported by each API server. It is a server-wide setting, so it is shared by all clients.
+_authentication_types: typing.Dict[str, str] = {}
+
+_CLIENT_VERSION = pv(__version__)
+
+# Headers sent with every request to the API server
+_API_HEADERS: typing.Dict[str, str] = {
+    'x-binstar-api-version': __version__,
+    'User-Agent': 'Anaconda-Client/{} (+https://anaconda.org)'.format(__version__),
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_api_version(version):
+    """Parse the version reported by the API server (a server reports the same value on every response)."""
+    return pv(version)
+
+
+_ERRORS_BY_STATUS: typing.Dict[int, typing.Type[errors.BinstarError]] = {
+    401: errors.Unauthorized,
+    404: errors.NotFound,
+    409: errors.Conflict,
+}
+
 
 class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-many-public-methods
     """
@@ -37,28 +98,28 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
     :param token: a token generated by Binstar.authenticate or None for
                   an anonymous user.
+    :param pool_size: maximum number of keep-alive connections kept per host. Raise it when
+                      issuing many requests concurrently.
     """
 
     def __init__(  # pylint: disable=unused-argument
             self, token=None, domain='https://api.anaconda.org',
-            verify=True, **kwargs
+            verify=True, pool_size=DEFAULT_POOL_SIZE, **kwargs
     ):
         self._session = requests.Session()
-        self._session.headers['x-binstar-api-version'] = __version__
+        self._pool_size = pool_size
+        adapter = KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=_make_retry())
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update(_API_HEADERS)
         self.session.verify = verify
         self.session.auth = NullAuth()
         self.token = token
         self._token_warning_sent = False
-
-        user_agent = 'Anaconda-Client/{} (+https://anaconda.org)'.format(__version__)
-        self._session.headers.update({
-            'User-Agent': user_agent,
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        })
+        self._server_checked_at = None
 
         if token:
-            self._session.headers.update({'Authorization': 'token {}'.format(token)})
+            self._session.headers['Authorization'] = 'token {}'.format(token)
 
         if domain.endswith('/'):
             domain = domain[:-1]
@@ -66,6 +127,17 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
             domain = 'https://' + domain
         self.domain = domain
 
+        # URL builders for the most frequently used endpoints
+        self._urls = types.SimpleNamespace(
+            packages=(domain + '/packages/{}').format,
+            package=(domain + '/package/{}/{}').format,
+            release=(domain + '/release/{}/{}/{}').format,
+            dist=(domain + '/dist/{}/{}/{}/{}').format,
+            download=(domain + '/download/{}/{}/{}/{}').format,
+            stage=(domain + '/stage/{}/{}/{}/{}').format,
+            commit=(domain + '/commit/{}/{}/{}/{}').format,
+        )
+
     @property
     def session(self):
         return self._session
@@ -75,6 +147,9 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         Checks if the server is reachable and throws
         and exception if it isn't
         """
+        if (self._server_checked_at is not None) and (monotonic() - self._server_checked_at < SERVER_CHECK_TTL):
+            return
+
         msg = 'API server not found. Please check your API url configuration.'
 
         try:
@@ -82,19 +157,28 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         except Exception as error:  # pylint: disable=broad-except
             raise errors.ServerError(msg) from error
 
+        if 200 <= response.status_code < 400:
+            self._server_checked_at = monotonic()
+            return
+
         try:
             self._check_response(response)
         except errors.NotFound as error:
             raise errors.ServerError(msg) from error
 
     def authentication_type(self):
+        try:
+            return _authentication_types[self.domain]
+        except KeyError:
+            pass
+
         url = '%s/authentication-type' % self.domain
         res = self.session.get(url)
         try:
             self._check_response(res)
-            res = res.json()
-            return res['authentication_type']
-        except BinstarError:
+            auth_type = _authentication_types[self.domain] = res.json()['authentication_type']
+            return auth_type
+        except errors.BinstarError:
             return 'password'
 
     def krb_authenticate(self, *args, **kwargs):
@@ -103,7 +187,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
             return self._authenticate(HTTPKerberosAuth(), *args, **kwargs)
         except ImportError as error:
             # pylint: disable=implicit-str-concat
-            raise BinstarError(
+            raise errors.BinstarError(
                 'Kerberos authentication requires the requests-kerberos package to be installed:\n'
                 '    conda install requests-kerberos\n'
                 'or: \n'
@@ -153,24 +237,20 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
     def list_scopes(self):
         url = f'{self.domain}/scopes'
-        res = requests.get(url, timeout=60)
+        res = self.session.get(url, timeout=60)
         self._check_response(res)
         return res.json()
 
     def authentication(self):
         """Retrieve information on the current authentication token."""
         url = '%s/authentication' % (self.domain)
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        return self._get_json(url)
 
     def authentications(self):
         """Get a list of the current authentication tokens."""
 
         url = '%s/authentications' % (self.domain)
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        return self._get_json(url)
 
     def remove_authentication(self, auth_name=None, organization=None):
         """
@@ -184,13 +264,11 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         else:
             url = '%s/authentications' % (self.domain,)
 
-        res = self.session.delete(url)
-        self._check_response(res, [201])
+        self._delete(url, [201])
 
-    def _check_response(self, res, allowed=None):
-        allowed = [200] if allowed is None else allowed
+    def _check_response(self, res, allowed=frozenset({200})):
         api_version = res.headers.get('x-binstar-api-version', '0.2.1')
-        if pv(api_version) > pv(__version__):
+        if api_version != __version__ and _parse_api_version(api_version) > _CLIENT_VERSION:
             # pylint: disable=implicit-str-concat
             logger.warning(
                 'The api server is running the binstar-api version %s. you are using %s\n'
@@ -219,17 +297,24 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
                 data = {}
 
             msg = data.get('error', msg)
-            ErrCls = errors.BinstarError
-            if res.status_code == 401:
-                ErrCls = errors.Unauthorized
-            elif res.status_code == 404:
-                ErrCls = errors.NotFound
-            elif res.status_code == 409:
-                ErrCls = errors.Conflict
-            elif res.status_code >= 500:
-                ErrCls = errors.ServerError
-
-            raise ErrCls(msg, res.status_code)
+            error_cls = _ERRORS_BY_STATUS.get(
+                res.status_code,
+                errors.ServerError if res.status_code >= 500 else errors.BinstarError,
+            )
+
+            raise error_cls(msg, res.status_code)
+
+    def _get_json(self, url, params=None):
+        """Send a GET request and return the decoded body of a successful response."""
+        res = self.session.get(url, params=params)
+        self._check_response(res)
+        return res.json()
+
+    def _delete(self, url, allowed=frozenset({200})):
+        """Send a DELETE request and check its response."""
+        res = self.session.delete(url)
+        self._check_response(res, allowed)
+        return res
 
     def user(self, login=None):
         """
@@ -243,10 +328,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         else:
             url = '%s/user' % (self.domain)
 
-        res = self.session.get(url, verify=self.session.verify)
-        self._check_response(res)
-
-        return res.json()
+        return self._get_json(url)
 
     def user_packages(
             self,
@@ -272,7 +354,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
            (e.g. 'private', 'authenticated', 'public')
         """
         if login:
-            url = '{0}/packages/{1}'.format(self.domain, login)
+            url = self._urls.packages(login)
         else:
             url = '{0}/packages'.format(self.domain)
 
@@ -287,10 +369,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         if access:
             arguments['access'] = access
 
-        res = self.session.get(url, params=arguments)
-        self._check_response(res)
-
-        return res.json()
+        return self._get_json(url, params=arguments)
 
     def package(self, login, package_name):
         """
@@ -299,10 +378,8 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param login: the login of the package owner
         :param package_name: the name of the package
         """
-        url = '%s/package/%s/%s' % (self.domain, login, package_name)
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        url = self._urls.package(login, package_name)
+        return self._get_json(url)
 
     def package_add_collaborator(self, owner, package_name, collaborator):
         url = '%s/packages/%s/%s/collaborators/%s' % (self.domain, owner, package_name, collaborator)
@@ -311,15 +388,12 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
     def package_remove_collaborator(self, owner, package_name, collaborator):
         url = '%s/packages/%s/%s/collaborators/%s' % (self.domain, owner, package_name, collaborator)
-        res = self.session.delete(url)
-        self._check_response(res, [201])
+        self._delete(url, [201])
 
     def package_collaborators(self, owner, package_name):
 
         url = '%s/packages/%s/%s/collaborators' % (self.domain, owner, package_name)
-        res = self.session.get(url)
-        self._check_response(res, [200])
-        return res.json()
+        return self._get_json(url)
 
     def all_packages(self, modified_after=None):
         url = '%s/package_listing' % (self.domain)
@@ -355,7 +429,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         if package_type is not None:
             package_type = package_type.value
 
-        url = '%s/package/%s/%s' % (self.domain, login, package_name)
+        url = self._urls.package(login, package_name)
 
         attrs = attrs or {}
         attrs['summary'] = summary
@@ -381,7 +455,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param package_name: the name of the package to be updated
         :param attrs: A dictionary of attributes to update
         """
-        url = '{}/package/{}/{}'.format(self.domain, login, package_name)
+        url = self._urls.package(login, package_name)
 
         payload = {'public_attrs': dict(attrs)}
         data, headers = jencode(payload)
@@ -398,7 +472,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param version: version of the package to update
         :param attrs: A dictionary of attributes to update
         """
-        url = '{}/release/{}/{}/{}'.format(self.domain, login, package_name, version)
+        url = self._urls.release(login, package_name, version)
         payload = {'public_attrs': dict(attrs)}
         data, headers = jencode(payload)
         res = self.session.patch(url, data=data, headers=headers)
@@ -407,10 +481,9 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
     def remove_package(self, username, package_name):
 
-        url = '%s/package/%s/%s' % (self.domain, username, package_name)
+        url = self._urls.package(username, package_name)
 
-        res = self.session.delete(url)
-        self._check_response(res, [201])
+        self._delete(url, [201])
 
     def release(self, login, package_name, version):
         """
@@ -420,10 +493,8 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param package_name: the name of the package
         :param version: the name of the package
         """
-        url = '%s/release/%s/%s/%s' % (self.domain, login, package_name, version)
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        url = self._urls.release(login, package_name, version)
+        return self._get_json(url)
 
     def remove_release(self, username, package_name, version):
         """
@@ -433,9 +504,8 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param package_name: the name of the package
         :param version: the name of the package
         """
-        url = '%s/release/%s/%s/%s' % (self.domain, username, package_name, version)
-        res = self.session.delete(url)
-        self._check_response(res, [201])
+        url = self._urls.release(username, package_name, version)
+        self._delete(url, [201])
 
     def add_release(self, login, package_name, version, requirements, announce, release_attrs):
         """
@@ -448,7 +518,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param announce: An announcement that will be posted to all package watchers
         """
 
-        url = '%s/release/%s/%s/%s' % (self.domain, login, package_name, version)
+        url = self._urls.release(login, package_name, version)
 
         if not release_attrs:
             release_attrs = {}
@@ -467,24 +537,20 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
     def distribution(self, login, package_name, release, basename=None):
 
-        url = '%s/dist/%s/%s/%s/%s' % (self.domain, login, package_name, release, basename)
+        url = self._urls.dist(login, package_name, release, basename)
 
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        return self._get_json(url)
 
     def remove_dist(self, login, package_name, release, basename=None, _id=None):
 
         if basename:
-            url = '%s/dist/%s/%s/%s/%s' % (self.domain, login, package_name, release, basename)
+            url = self._urls.dist(login, package_name, release, basename)
         elif _id:
             url = '%s/dist/%s/%s/%s/-/%s' % (self.domain, login, package_name, release, _id)
         else:
             raise TypeError("method remove_dist expects either 'basename' or '_id' arguments")
 
-        res = self.session.delete(url)
-        self._check_response(res)
-        return res.json()
+        return self._delete(url).json()
 
     def download(self, login, package_name, release, basename, md5=None):
         """
@@ -500,7 +566,7 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :returns: a file like object or None
         """
 
-        url = '%s/download/%s/%s/%s/%s' % (self.domain, login, package_name, release, basename)
+        url = self._urls.download(login, package_name, release, basename)
         if md5:
             headers = {'ETag': md5, }
         else:
@@ -517,17 +583,16 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
             return None
         if res.status_code == 302:
             # Download from s3:
-            # We need to create a new request (without using session) to avoid
-            # sending the custom headers set on our session to S3 (which causes
-            # a failure).
-            res2 = requests.get(res.headers['location'], stream=True, timeout=10 * 60 * 60)
+            # We need to use a separate session to avoid sending the custom
+            # headers set on our session to S3 (which causes a failure).
+            res2 = _s3_session.get(res.headers['location'], stream=True, timeout=10 * 60 * 60)
             return res2
 
         return None
 
     def upload(self, login, package_name, release, basename, file, distribution_type,
                description='', md5=None, sha256=None, size=None, dependencies=None, attrs=None,
-               channels=('main',)):
+               channels=('main',), progress_bar=None):
         """
         Upload a new distribution to a package release.
 
@@ -544,14 +609,24 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         :param dependencies: (optional) list package dependencies
         :param attrs: any extra attributes about the file (eg. build=1, pyversion='2.7', os='osx')
         :param channels: list of labels package will be available from
+        :param progress_bar: (optional) a progress bar to report uploaded bytes to instead of a new one for this file
         """
-        url = '%s/stage/%s/%s/%s/%s' % (self.domain, login, package_name, release, quote(basename))
+        url = self._urls.stage(login, package_name, release, quote(basename))
         if attrs is None:
             attrs = {}
         if not isinstance(attrs, dict):
             raise TypeError('argument attrs must be a dictionary')
 
-        sha256 = sha256 if sha256 is not None else compute_hash(file, size=size, hash_algorithm=hashlib.sha256)[0]
+        if sha256 is None or md5 is None:
+            (hexsha256, _b64sha256, size), (_hexmd5, b64md5, _size) = compute_hashes(
+                file, size=size, algorithms=(hashlib.sha256, hashlib.md5))
+            sha256 = sha256 if sha256 is not None else hexsha256
+            md5 = md5 if md5 is not None else b64md5
+        elif size is None:
+            spos = file.tell()
+            file.seek(0, os.SEEK_END)
+            size = file.tell() - spos
+            file.seek(spos)
 
         if not isinstance(distribution_type, str):
             distribution_type = distribution_type.value
@@ -573,32 +648,29 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
         s3url = obj['post_url']
         s3data = obj['form_data']
 
-        if md5 is None:
-            _hexmd5, b64md5, size = compute_hash(file, size=size)
-        elif size is None:
-            spos = file.tell()
-            file.seek(0, os.SEEK_END)
-            size = file.tell() - spos
-            file.seek(spos)
-
         s3data['Content-Length'] = str(size)
-        s3data['Content-MD5'] = b64md5
+        s3data['Content-MD5'] = md5
+
+        session = self.session if urlparse(s3url)[:2] == urlparse(self.domain)[:2] else _s3_session
 
-        file_size = os.fstat(file.fileno()).st_size
-        with tqdm(total=file_size, unit='B', unit_scale=True, unit_divisor=1024) as progress:
+        if progress_bar is None:
+            file_size = os.fstat(file.fileno()).st_size
+            progress_context = tqdm(total=file_size, unit='B', unit_scale=True, unit_divisor=1024)
+        else:
+            progress_context = contextlib.nullcontext(progress_bar)
+        with progress_context as progress:
             s3res = multipart_files_upload(
                 s3url, s3data, {'file': (basename, file)}, progress,
-                verify=self.session.verify)
+                session=session, verify=self.session.verify)
 
         if s3res.status_code != 201:
             logger.info(s3res.text)
-            xml_error = ET.fromstring(s3res.text)
             msg_tail = ''
-            if xml_error.find('Code').text == 'InvalidDigest':
+            if '<Code>InvalidDigest</Code>' in s3res.text:
                 msg_tail = ' The Content-MD5 or checksum value is not valid.'
             raise errors.BinstarError('Error uploading package!%s' % msg_tail, s3res.status_code)
 
-        url = '%s/commit/%s/%s/%s/%s' % (self.domain, login, package_name, release, quote(basename))
+        url = self._urls.commit(login, package_name, release, quote(basename))
         payload = {'dist_id': obj['dist_id']}
         data, headers = jencode(payload)
         res = self.session.post(url, data=data, headers=headers)
@@ -606,22 +678,74 @@ class Binstar(OrgMixin, ChannelsMixin, PackageMixin):  # pylint: disable=too-man
 
         return res.json()
 
+    def upload_many(self, items, max_workers=8):
+        """
+        Upload several distributions concurrently.
+
+        Progress of all uploads is reported on a single progress bar.
+
+        :param items: list of dictionaries with keyword arguments for :meth:`upload`
+        :param max_workers: maximum number of concurrent uploads, capped by the `pool_size` of this client and by
+                            :data:`STORAGE_POOL_SIZE`
+        :returns: list of results of :meth:`upload`, in the same order as `items`
+        """
+        total = sum(os.fstat(item['file'].fileno()).st_size for item in items)
+        with tqdm(total=total, unit='B', unit_scale=True, unit_divisor=1024) as progress:
+            return self._map_concurrently(
+                functools.partial(self.upload, progress_bar=progress), items,
+                max_workers=min(max_workers, STORAGE_POOL_SIZE))
+
+    def _map_concurrently(self, func, items, max_workers=8):
+        """
+        Call `func` with keyword arguments from each of `items` on a thread pool.
+
+        The number of workers is capped by the `pool_size` of this client, so workers never wait for a connection.
+
+        :returns: list of results, in the same order as `items`
+        """
+        max_workers = max(1, min(max_workers, self._pool_size))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            jobs = [executor.submit(func, **item) for item in items]
+            return [job.result() for job in jobs]
+
     def search(self, query, package_type=None, platform=None):
         if package_type is not None:
             package_type = package_type.value
 
         url = '%s/search' % self.domain
-        res = self.session.get(url, params={
+        return self._get_json(url, params={
             'name': query,
             'type': package_type,
             'platform': platform,
         })
-        self._check_response(res)
-        return res.json()
+
+    def search_many(self, queries, package_type=None, platform=None, max_workers=8):
+        """
+        Run several searches concurrently.
+
+        :param queries: list of search queries
+        :param max_workers: maximum number of concurrent requests, capped by the `pool_size` of this client
+        :returns: list of results of :meth:`search`, in the same order as `queries`
+        """
+        return self._map_concurrently(
+            self.search,
+            [{'query': query, 'package_type': package_type, 'platform': platform} for query in queries],
+            max_workers=max_workers,
+        )
+
+    def user_packages_many(self, logins, max_workers=8, **filters):
+        """
+        List packages of several users concurrently.
+
+        :param logins: list of user logins
+        :param max_workers: maximum number of concurrent requests, capped by the `pool_size` of this client
+        :param filters: filters for :meth:`user_packages` (`platform`, `package_type`, `type_`, `access`)
+        :returns: list of results of :meth:`user_packages`, in the same order as `logins`
+        """
+        return self._map_concurrently(
+            self.user_packages, [dict(filters, login=login) for login in logins], max_workers=max_workers)
 
     def user_licenses(self):
         """Download the user current trial/paid licenses."""
         url = '{domain}/license'.format(domain=self.domain)
-        res = self.session.get(url)
-        self._check_response(res)
-        return res.json()
+        return self._get_json(url)
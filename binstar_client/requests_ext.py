@@ -3,11 +3,13 @@
 from __future__ import unicode_literals
 
 import logging
+import socket
 from io import BytesIO, StringIO
 from itertools import chain
 
 import requests
 import six
+from urllib3.connection import HTTPConnection
 from urllib3.filepost import choose_boundary
 
 logger = logging.getLogger('binstar.requests_ext')
@@ -38,6 +40,25 @@ class NullAuth(requests.auth.AuthBase):  # pylint: disable=too-few-public-method
         return r
 
 
+class KeepAliveAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter which enables TCP keep-alive probes on its connections
+
+    Keep-alive probes stop idle pooled connections from being silently dropped by
+    firewalls and NAT gateways between requests. ``TCP_NODELAY`` (part of urllib3
+    defaults) is kept, so small JSON requests are not delayed by Nagle's algorithm.
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        kwargs.setdefault('socket_options', self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault('socket_options', self.socket_options)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
 def encode_multipart_formdata_stream(fields, boundary=None):
     """
     Encode a dictionary of ``fields`` using the multipart/form-data MIME format.
@@ -6,7 +6,7 @@ import base64
 import json
 import logging
 import sys
-from hashlib import md5
+from hashlib import md5, sha256
 
 from six.moves import input
 
@@ -53,7 +53,7 @@ else:
 
 def jencode(*E, **F):
     payload = dict(*E, **F)
-    return json.dumps(payload), {'Content-Type': 'application/json'}
+    return json.dumps(payload, separators=(',', ':')), {'Content-Type': 'application/json'}
 
 
 def compute_hash(file, buf_size=8192, size=None, hash_algorithm=md5):
@@ -83,6 +83,44 @@ def compute_hash(file, buf_size=8192, size=None, hash_algorithm=md5):
     return (hex_digest, base64_digest, data_size)
 
 
+def compute_hashes(file, size=None, algorithms=(sha256, md5), buf_size=1 << 20):
+    """
+    Compute several digests of `file` in a single pass.
+
+    Reading starts at the current position and stops after `size` bytes (or at the end of the file). The file is seeked
+    back to its original position afterwards.
+
+    :return: list of ``(hex_digest, base64_digest, data_size)`` tuples, one per item of `algorithms`.
+    """
+    hash_objs = [algorithm() for algorithm in algorithms]
+    spos = file.tell()
+    buffer = bytearray(buf_size)
+    view = memoryview(buffer)
+    remaining = size
+    while remaining is None or remaining > 0:
+        limit = buf_size if remaining is None else min(buf_size, remaining)
+        if hasattr(file, 'readinto'):
+            count = file.readinto(view[:limit])
+            chunk = view[:count]
+        else:
+            chunk = file.read(limit)
+            count = len(chunk)
+        if not count:
+            break
+        for hash_obj in hash_objs:
+            hash_obj.update(chunk)
+        if remaining is not None:
+            remaining -= count
+
+    # data_size based on bytes read.
+    data_size = file.tell() - spos
+    file.seek(spos)
+    return [
+        (hash_obj.hexdigest(), b64encode(hash_obj.digest()).rstrip('\n'), data_size)
+        for hash_obj in hash_objs
+    ]
+
+
 def bool_input(prompt, default=True):
     default_str = '[Y|n]' if default else '[y|N]'
     while True:
@@ -1,4 +1,5 @@
 """Multipart form utils."""
+import threading
 import typing
 
 import requests
@@ -7,12 +8,16 @@ from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 if typing.TYPE_CHECKING:
     import tqdm
 
+# Serializes progress updates, as several concurrent uploads may report to the same progress bar
+_progress_lock = threading.Lock()
+
 
 def multipart_files_upload(
         url: str,
         data: typing.MutableMapping,
         files: typing.Optional[typing.Mapping[str, tuple]] = None,
         progress_bar: typing.Optional['tqdm.tqdm'] = None,
+        session: typing.Optional[requests.Session] = None,
         **request_kwargs: typing.Any) -> requests.Response:
     """
     Uploads one or more files as a multipart form.
@@ -21,6 +26,7 @@ def multipart_files_upload(
     :param data: Dictionary, list of tuples, bytes, or file-like object to send in as a multipart form.
     :param files: Dictionary of ``{'name': file-tuple}`` for multipart encoding upload.
     :param progress_bar: An optional progress bar to display the upload progress.
+    :param session: An optional session to send the request with, so its connections can be reused.
     :param request_kwargs: Any additional keyword arguments to pass to the `requests.post()` function.
 
     """
@@ -30,11 +36,20 @@ def multipart_files_upload(
     encoder = MultipartEncoder(data)
 
     if progress_bar:
-        encoder = MultipartEncoderMonitor(
-            encoder, lambda monitor: progress_bar.update(monitor.bytes_read - progress_bar.n)
-        )
+        bar = progress_bar
+        bytes_read = 0
+
+        def update_progress(monitor: MultipartEncoderMonitor) -> None:
+            # Report increments only, so the same progress bar may be shared by several uploads.
+            nonlocal bytes_read
+            with _progress_lock:
+                bar.update(monitor.bytes_read - bytes_read)
+            bytes_read = monitor.bytes_read
+
+        encoder = MultipartEncoderMonitor(encoder, update_progress)
 
-    return requests.post(
+    post = requests.post if session is None else session.post
+    return post(
         url,
         data=encoder,
         headers={'Content-Type': encoder.content_type},
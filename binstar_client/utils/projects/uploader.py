@@ -1,9 +1,11 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 
+import hashlib
+
 import tqdm
 
 import binstar_client
-from binstar_client.utils import compute_hash, jencode
+from binstar_client.utils import compute_hashes, jencode
 from binstar_client.utils.multipart_uploader import multipart_files_upload
 
 
@@ -46,8 +48,8 @@ class ProjectUploader(binstar_client.Binstar):
         return res
 
     def file_upload(self, url, obj):
-        _hexmd5, b64md5, size = compute_hash(
-            self.project.tar, size=self.project.size)
+        (_hexmd5, b64md5, size), = compute_hashes(
+            self.project.tar, size=self.project.size, algorithms=(hashlib.md5,))
 
         s3data = obj['form_data']
         s3data['Content-Length'] = str(size)
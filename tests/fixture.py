@@ -33,6 +33,9 @@ class CLITestCase(unittest.TestCase):  # pylint: disable=too-many-instance-attri
         self.setup_logging_patch = mock.patch('binstar_client.scripts.cli._setup_logging')
         self.setup_logging_patch.start()
 
+        self.authentication_types_patch = mock.patch.dict('binstar_client._authentication_types', clear=True)
+        self.authentication_types_patch.start()
+
         self.logger = logger = logging.getLogger('binstar')
         logger.setLevel(logging.INFO)
         self.stream = AnyIO()
@@ -45,5 +48,6 @@ class CLITestCase(unittest.TestCase):  # pylint: disable=too-many-instance-attri
         self.get_config_patch.stop()
         self.load_token_patch.stop()
         self.store_token_patch.stop()
+        self.authentication_types_patch.stop()
 
         self.logger.removeHandler(self.hndlr)
@@ -47,12 +47,13 @@ class Test(CLITestCase):
         getpass.return_value = 'password'
 
         urls.register(path='/', method='HEAD', status=200)
-        urls.register(path='/authentication-type', status=404)
+        auth_type = urls.register(path='/authentication-type', status=404)
 
         auth = urls.register(method='POST', path='/authentications', content='{"token": "a-token"}')
         main(['--show-traceback', 'login'], False)
         self.assertIn('login successful', self.stream.getvalue())
 
+        auth_type.assertCalled()
         auth.assertCalled()
 
         self.assertIn('Authorization', auth.req.headers)
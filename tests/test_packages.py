@@ -35,6 +35,26 @@ class Test(unittest.TestCase):
         self.assertEqual(packages, [])
         urls.assertAllCalled()
 
+    @urlpatch
+    def test_user_packages_many(self, urls):
+        api = Binstar()
+        urls.register(method='GET', path='/packages/u1?platform=osx-64', content='[{"name": "a"}]')
+        urls.register(method='GET', path='/packages/u2?platform=osx-64', content='[]')
+
+        packages = api.user_packages_many(['u1', 'u2'], platform='osx-64', max_workers=2)
+
+        self.assertEqual(packages, [[{'name': 'a'}], []])
+        urls.assertAllCalled()
+
+    @urlpatch
+    def test_search_many(self, urls):
+        api = Binstar()
+        urls.register(method='GET', path='/search?name=foo', content='[{"name": "foo"}]')
+        urls.register(method='GET', path='/search?name=bar', content='[]')
+
+        self.assertEqual(api.search_many(['foo', 'bar']), [[{'name': 'foo'}], []])
+        urls.assertAllCalled()
+
 
 if __name__ == '__main__':
     unittest.main()
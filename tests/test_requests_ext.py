@@ -3,6 +3,7 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 
 import io
+import socket
 import unittest
 
 from binstar_client import requests_ext
@@ -15,5 +16,13 @@ class TestMultiPart(unittest.TestCase):
         self.assertEqual('Unicode™'.encode('utf-8'), multipart.read())
 
 
+class TestKeepAliveAdapter(unittest.TestCase):
+    def test_socket_options(self):
+        adapter = requests_ext.KeepAliveAdapter()
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), socket_options)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,184 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+import time
+import unittest
+from unittest import mock
+
+import binstar_client
+from binstar_client import SERVER_CHECK_TTL, STORAGE_POOL_SIZE, Binstar, errors
+from binstar_client.utils import multipart_uploader
+from tests.urlmock import urlpatch
+from tests.utils.utils import data_dir
+
+
+class Test(unittest.TestCase):
+    def test_adapter_pool_size(self):
+        api = Binstar(pool_size=4)
+        for prefix in ('https://', 'http://'):
+            adapter = api.session.get_adapter(prefix + 'api.anaconda.org')
+            self.assertEqual(adapter._pool_maxsize, 4)  # pylint: disable=protected-access
+            self.assertEqual(adapter.max_retries.total, 3)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_session_headers(self):
+        headers = Binstar(token='abc').session.headers
+        self.assertEqual(headers['Authorization'], 'token abc')
+        self.assertEqual(headers['Accept'], 'application/json')
+        self.assertTrue(headers['User-Agent'].startswith('Anaconda-Client/'))
+        self.assertNotIn('Authorization', Binstar().session.headers)
+
+    def test_error_reexports(self):
+        for name in dir(errors):
+            if not name.startswith('_'):
+                self.assertIs(getattr(binstar_client, name), getattr(errors, name))
+
+    @urlpatch
+    def test_list_scopes_uses_session(self, urls):
+        api = Binstar(token='abc')
+        urls.register(method='GET', path='/scopes', content='{}', expected_headers={'Authorization': 'token abc'})
+
+        self.assertEqual(api.list_scopes(), {})
+        urls.assertAllCalled()
+
+    @urlpatch
+    def test_download_redirect_drops_api_headers(self, urls):
+        api = Binstar(token='abc')
+        urls.register(
+            method='GET', path='/download/u1/foo/0.1/foo.tar.bz2', status=302,
+            headers={'location': 'https://s3.example.com/foo.tar.bz2'},
+        )
+        s3_download = urls.register(method='GET', url='https://s3.example.com/foo.tar.bz2', content=b'data')
+
+        res = api.download('u1', 'foo', '0.1', 'foo.tar.bz2')
+
+        self.assertEqual(res.content, b'data')
+        self.assertNotIn('Authorization', s3_download.req.headers)
+        self.assertNotIn('x-binstar-api-version', s3_download.req.headers)
+
+    @urlpatch
+    def test_upload_storage_drops_api_headers(self, urls):
+        api = Binstar(token='abc')
+        for post_url in ('https://api.anaconda.org.example.com/s3_url', 'https://api.anaconda.org:8443/s3_url'):
+            with self.subTest(post_url=post_url):
+                content = {'post_url': post_url, 'form_data': {}, 'dist_id': 'dist_id'}
+                urls.register(method='POST', path='/stage/u1/foo/0.1/foo-0.1-0.tar.bz2', content=content)
+                urls.register(method='POST', path='/commit/u1/foo/0.1/foo-0.1-0.tar.bz2', content={})
+                s3_upload = urls.register(method='POST', url=post_url, status=201)
+
+                with open(data_dir('foo-0.1-0.tar.bz2'), 'rb') as file:
+                    api.upload('u1', 'foo', '0.1', 'foo-0.1-0.tar.bz2', file, 'conda')
+
+                self.assertNotIn('Authorization', s3_upload.req.headers)
+                self.assertNotIn('x-binstar-api-version', s3_upload.req.headers)
+
+    @mock.patch.dict('binstar_client._authentication_types', clear=True)
+    @urlpatch
+    def test_authentication_type_is_cached(self, urls):
+        auth_type = urls.register(path='/authentication-type', content='{"authentication_type": "kerberos"}')
+
+        self.assertEqual(Binstar().authentication_type(), 'kerberos')
+        self.assertEqual(Binstar().authentication_type(), 'kerberos')
+        self.assertEqual(auth_type.called, 1)
+
+    @urlpatch
+    def test_error_classes(self, urls):
+        api = Binstar()
+        for status, error_cls in ((401, errors.Unauthorized), (404, errors.NotFound), (409, errors.Conflict),
+                                  (503, errors.ServerError), (400, errors.BinstarError)):
+            with self.subTest(status=status):
+                urls.register(path='/user', status=status, content='{}')
+                with self.assertRaises(error_cls) as context:
+                    api.user()
+                self.assertEqual(context.exception.args[1], status)
+
+    @urlpatch
+    def test_newer_api_version_warning(self, urls):
+        api = Binstar()
+        urls.register(path='/user', content='{}', headers={'x-binstar-api-version': '999.0'})
+
+        with self.assertLogs('binstar', level='WARNING') as logs:
+            api.user()
+            api.user()
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('999.0', logs.output[0])
+
+    @urlpatch
+    def test_upload_many(self, urls):
+        api = Binstar()
+        basenames = ('foo-0.1-0.tar.bz2', 'test_package34-0.3.1.tar.gz')
+        for basename in basenames:
+            content = {'post_url': 'http://s3url.com/s3_url', 'form_data': {}, 'dist_id': basename}
+            urls.register(method='POST', path='/stage/u1/foo/0.1/' + basename, content=content)
+            urls.register(method='POST', path='/commit/u1/foo/0.1/' + basename, content={'basename': basename})
+        urls.register(method='POST', path='/s3_url', status=201)
+
+        with open(data_dir(basenames[0]), 'rb') as first, open(data_dir(basenames[1]), 'rb') as second:
+            results = api.upload_many([
+                {'login': 'u1', 'package_name': 'foo', 'release': '0.1', 'basename': basename, 'file': file,
+                 'distribution_type': 'conda'}
+                for basename, file in zip(basenames, (first, second))
+            ], max_workers=2)
+
+        self.assertEqual(results, [{'basename': basename} for basename in basenames])
+        urls.assertAllCalled()
+
+    def test_upload_many_workers(self):
+        api = Binstar(pool_size=64)
+        with mock.patch.object(api, '_map_concurrently') as map_concurrently:
+            api.upload_many([], max_workers=64)
+        self.assertEqual(map_concurrently.call_args[1]['max_workers'], STORAGE_POOL_SIZE)
+
+    def test_upload_progress_is_locked(self):
+        progress_lock = multipart_uploader._progress_lock  # pylint: disable=protected-access
+        progress_bar = mock.Mock(n=0)
+        progress_bar.update.side_effect = lambda _: self.assertTrue(progress_lock.locked())
+        session = mock.Mock()
+        session.post.side_effect = lambda url, data, **kwargs: data.read()
+
+        with open(data_dir('foo-0.1-0.tar.bz2'), 'rb') as file:
+            multipart_uploader.multipart_files_upload(
+                'http://s3url.com/s3_url', {}, {'file': ('foo-0.1-0.tar.bz2', file)}, progress_bar, session=session)
+
+        self.assertTrue(progress_bar.update.called)
+
+    @urlpatch
+    def test_upload_storage_error(self, urls):
+        api = Binstar()
+        content = {'post_url': 'http://s3url.com/s3_url', 'form_data': {}, 'dist_id': 'dist_id'}
+        urls.register(method='POST', path='/stage/u1/foo/0.1/foo-0.1-0.tar.bz2', content=content)
+
+        for body, message in (
+                ('<?xml version="1.0"?><Error><Code>InvalidDigest</Code></Error>', 'checksum value is not valid'),
+                ('not xml', 'Error uploading package!'),
+        ):
+            with self.subTest(body=body):
+                urls.register(method='POST', path='/s3_url', status=400, content=body)
+                with open(data_dir('foo-0.1-0.tar.bz2'), 'rb') as file:
+                    with self.assertRaises(errors.BinstarError) as context:
+                        api.upload('u1', 'foo', '0.1', 'foo-0.1-0.tar.bz2', file, 'conda')
+                self.assertIn(message, context.exception.message)
+
+    @urlpatch
+    def test_check_server(self, urls):
+        api = Binstar()
+        head = urls.register(method='HEAD', path='/', status=200)
+
+        api.check_server()
+        api.check_server()
+        self.assertEqual(head.called, 1)
+
+        with mock.patch('binstar_client.monotonic', return_value=time.monotonic() + SERVER_CHECK_TTL):
+            api.check_server()
+        self.assertEqual(head.called, 2)
+
+    @urlpatch
+    def test_check_server_not_found(self, urls):
+        urls.register(method='HEAD', path='/', status=404)
+
+        with self.assertRaises(errors.ServerError):
+            Binstar().check_server()
+
+
+if __name__ == '__main__':
+    unittest.main()
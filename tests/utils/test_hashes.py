@@ -0,0 +1,30 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+
+import hashlib
+import io
+import unittest
+
+from binstar_client.utils import compute_hash, compute_hashes
+
+
+class ComputeHashesTestCase(unittest.TestCase):
+    def test_matches_compute_hash(self):
+        file = io.BytesIO(b'0123456789' * 1000)
+        sha256_digest, md5_digest = compute_hashes(file, buf_size=64)
+
+        self.assertEqual(sha256_digest, compute_hash(file, hash_algorithm=hashlib.sha256))
+        self.assertEqual(md5_digest, compute_hash(file))
+        self.assertEqual(file.tell(), 0)
+
+    def test_size_and_position(self):
+        file = io.BytesIO(b'0123456789')
+        file.seek(2)
+        (hex_digest, _b64_digest, data_size), = compute_hashes(file, size=5, algorithms=(hashlib.md5,))
+
+        self.assertEqual(hex_digest, hashlib.md5(b'23456').hexdigest())  # nosec
+        self.assertEqual(data_size, 5)
+        self.assertEqual(file.tell(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()